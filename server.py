@@ -1,6 +1,14 @@
 from fastmcp import FastMCP
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+import asyncio
 import logging
+import time
+import diskcache # Persistent on-disk response cache, survives restarts
+import hishel # RFC 9111 HTTP caching transport (conditional GETs / 304s)
 import httpx # For making HTTP requests to PokeAPI
+import msgspec # Typed validation of the PokeAPI response subsets we use
+import orjson # Faster JSON decoding than the stdlib for large PokeAPI payloads
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -23,14 +31,293 @@ Tips for effective use:
 - The `list_all_pokemon_names` tool can be a starting point for broader searches if specific names are unknown.
 """
 
-mcp = FastMCP("PokeAPI MCP Server", instructions=SERVER_INSTRUCTIONS) # Standardized server name
-
 POKEAPI_BASE_URL = "https://pokeapi.co/api/v2"
+_BASE_LEN = len(POKEAPI_BASE_URL)
+HTTP_CACHE_PATH = "./.hishel"
+
+# Shared HTTP client, created lazily on the running event loop so keep-alive
+# connections to pokeapi.co are reused across tool calls instead of paying a
+# fresh TCP+TLS handshake per request. PokeAPI supports HTTP/2, so a handful
+# of connections can multiplex many concurrent in-flight requests; the
+# listing fan-out semaphore is deliberately sized above max_connections
+# since streams share connections.
+_client: httpx.AsyncClient | None = None
+
+async def get_client() -> httpx.AsyncClient:
+    """Returns the shared httpx.AsyncClient, creating it on first use.
+
+    The client is module-global so its connection pool persists across tool
+    calls. It is created lazily (not at import time) so it is bound to the
+    event loop the server actually runs on.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        # The hishel transport honours PokeAPI's Cache-Control/ETag headers,
+        # so warm entries revalidate with a ~200 B conditional GET (304)
+        # instead of re-downloading the full payload.
+        transport = hishel.AsyncCacheTransport(
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4, keepalive_expiry=60),
+            ),
+            storage=hishel.AsyncFileStorage(base_path=HTTP_CACHE_PATH),
+        )
+        _client = httpx.AsyncClient(base_url=POKEAPI_BASE_URL, transport=transport)
+    return _client
+
+# Static snapshot of the full Pokémon index. The list only changes when
+# PokeAPI ships a new generation, so it is fetched once at startup and
+# refreshed hourly in the background; list_all_pokemon_names serves it
+# from memory with slice-based pagination.
+SNAPSHOT_ENDPOINT = "/pokemon?limit=100000&offset=0"
+SNAPSHOT_REFRESH_SECONDS = 60 * 60
+_ALL_POKEMON: tuple[str, ...] = ()
+_ALL_COUNT: int = 0
+_NAME_TO_ID: dict[str, int] = {}
+
+def _canonical_identifier(processed_input: str) -> str:
+    """Maps a Pokémon name to its numeric ID when the snapshot is loaded.
+    ID lookups avoid PokeAPI's server-side name resolution, and they
+    collapse "pikachu" and "25" onto one cache key.
+    """
+    pokemon_id = _NAME_TO_ID.get(processed_input)
+    return str(pokemon_id) if pokemon_id is not None else processed_input
+
+async def _load_pokemon_snapshot() -> bool:
+    """Fetches the full Pokémon name index into module state, including the
+    name -> ID table derived from the entry URLs.
+    Bypasses the response cache so the hourly refresh sees fresh data.
+    Returns True on success.
+    """
+    global _ALL_POKEMON, _ALL_COUNT, _NAME_TO_ID
+    data = await _fetch_name_index(SNAPSHOT_ENDPOINT, with_ids=True)
+    if data.get("error"):
+        logger.warning(f"Could not load Pokémon name snapshot: {data.get('error')}")
+        return False
+    _ALL_POKEMON = tuple(data["names"])
+    _ALL_COUNT = data["count"]
+    _NAME_TO_ID = data["ids"]
+    logger.info(f"Loaded Pokémon name snapshot: {len(_ALL_POKEMON)} names (count={_ALL_COUNT})")
+    return True
+
+async def _refresh_pokemon_snapshot() -> None:
+    """Background task that re-fetches the name snapshot every hour."""
+    while True:
+        await asyncio.sleep(SNAPSHOT_REFRESH_SECONDS)
+        try:
+            await _load_pokemon_snapshot()
+        except Exception as e:
+            logger.error(f"Pokémon name snapshot refresh failed: {e}")
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Server lifespan: loads the Pokémon name snapshot, keeps it fresh in
+    the background, and closes the shared HTTP client on shutdown.
+    """
+    global _client
+    await _load_pokemon_snapshot()
+    refresh_task = asyncio.create_task(_refresh_pokemon_snapshot())
+    try:
+        yield
+    finally:
+        refresh_task.cancel()
+        if _client is not None:
+            await _client.aclose()
+            _client = None
+
+def _serialize_tool_result(data) -> str:
+    """Serializes tool return values with orjson instead of the framework's
+    default encoder; several times faster for the ~50 KB detail payloads.
+    """
+    return orjson.dumps(data).decode()
+
+mcp = FastMCP("PokeAPI MCP Server", instructions=SERVER_INSTRUCTIONS,
+              lifespan=_lifespan, tool_serializer=_serialize_tool_result) # Standardized server name
+
+# In-memory LRU cache for PokeAPI responses, keyed by endpoint. PokeAPI data
+# is effectively immutable, so a long TTL is safe; PokeAPI's own docs ask
+# clients to cache. Error responses are never cached.
+CACHE_MAX_SIZE = 4096
+CACHE_TTL_SECONDS = 24 * 60 * 60
+_response_cache: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+# On-disk cache layered below the in-memory LRU so a restart does not
+# re-fetch every resource. PokeAPI data is effectively immutable, so
+# entries never expire; the hot set stays in RAM via the LRU above.
+DISK_CACHE_PATH = "./.pokeapi-cache"
+DISK_CACHE_SIZE_LIMIT = 2**30 # 1 GiB
+_disk_cache = diskcache.Cache(DISK_CACHE_PATH, size_limit=DISK_CACHE_SIZE_LIMIT)
+
+def _cache_get(endpoint: str) -> dict | None:
+    """Returns a cached response for an endpoint, or None on miss/expiry."""
+    cached = _response_cache.get(endpoint)
+    if cached is None:
+        return None
+    fetched_at, data = cached
+    if time.monotonic() - fetched_at > CACHE_TTL_SECONDS:
+        del _response_cache[endpoint]
+        return None
+    _response_cache.move_to_end(endpoint)
+    # Shallow copy so callers mutating the result don't corrupt the cache.
+    return dict(data)
+
+def _cache_set(endpoint: str, data: dict) -> None:
+    """Stores a successful response, evicting the least recently used entry."""
+    _response_cache[endpoint] = (time.monotonic(), data)
+    _response_cache.move_to_end(endpoint)
+    while len(_response_cache) > CACHE_MAX_SIZE:
+        _response_cache.popitem(last=False)
+
+class ListEntry(msgspec.Struct):
+    name: str
+
+class ListResponse(msgspec.Struct):
+    count: int
+    results: list[ListEntry] = msgspec.field(default_factory=list)
+
+class IndexEntry(msgspec.Struct):
+    name: str
+    url: str
+
+class IndexResponse(msgspec.Struct):
+    count: int
+    results: list[IndexEntry] = msgspec.field(default_factory=list)
+
+async def _fetch_name_index(endpoint: str, with_ids: bool = False) -> dict:
+    """Fetches a paginated listing endpoint, decoding only 'count' and the
+    'name' of each result. msgspec skips unknown fields during decoding, so
+    the per-entry 'url' strings and result dicts are never materialized —
+    roughly halving allocation for the ~1300-entry Pokémon listing.
+
+    When with_ids is True, the entry urls are decoded too and each result's
+    trailing numeric resource ID is extracted into a name -> id mapping
+    (the listing order is not a reliable ID source: form entries jump to
+    IDs above 10000).
+
+    Returns {"count": int, "names": list[str]} (plus "ids" when requested)
+    or an error dictionary.
+    """
+    try:
+        client = await get_client()
+        response = await client.get(endpoint)
+        response.raise_for_status()
+        if with_ids:
+            listing = msgspec.json.decode(response.content, type=IndexResponse)
+            ids = {}
+            for entry in listing.results:
+                tail = entry.url.rstrip('/').rsplit('/', 1)[-1]
+                if tail.isdigit():
+                    ids[entry.name] = int(tail)
+            return {"count": listing.count,
+                    "names": [entry.name for entry in listing.results],
+                    "ids": ids}
+        listing = msgspec.json.decode(response.content, type=ListResponse)
+        return {"count": listing.count, "names": [entry.name for entry in listing.results]}
+    except msgspec.ValidationError as e:
+        logger.error(f"Error decoding PokeAPI listing: {e}")
+        return {"error": "Failed to process listing", "details": str(e)}
+    except httpx.HTTPStatusError as e:
+        logger.error(f"PokeAPI listing request failed: {e.response.status_code}")
+        return {"error": f"API request failed with status {e.response.status_code}",
+                "status_code": e.response.status_code, "details": e.response.text}
+    except httpx.RequestError as e:
+        logger.error(f"PokeAPI listing request error: {e}")
+        return {"error": "API request error", "details": str(e)}
+    except Exception as e:
+        logger.error(f"An unexpected error occurred while fetching a PokeAPI listing: {e}")
+        return {"error": "An unexpected error occurred", "details": str(e)}
+
+# Typed schemas for the subset of PokeAPI fields each tool actually uses.
+# msgspec ignores unknown fields, so the large untouched parts of each
+# payload are validated away for free, and a single ValidationError replaces
+# the per-field try/except walks at the tool boundary.
+class NamedResource(msgspec.Struct):
+    name: str
+
+class TypeSlot(msgspec.Struct):
+    type: NamedResource
+
+class StatSlot(msgspec.Struct):
+    base_stat: int
+    stat: NamedResource
+
+class PokemonResponse(msgspec.Struct):
+    id: int
+    name: str
+    height: int
+    weight: int
+    types: list[TypeSlot] = msgspec.field(default_factory=list)
+    stats: list[StatSlot] = msgspec.field(default_factory=list)
+    sprites: dict = msgspec.field(default_factory=dict)
+
+class SpeciesResponse(msgspec.Struct):
+    id: int
+    name: str
+    color: NamedResource | None = None
+    shape: NamedResource | None = None
+
+class EffectEntry(msgspec.Struct):
+    language: NamedResource
+    short_effect: str = "N/A"
+
+class ItemResponse(msgspec.Struct):
+    id: int
+    name: str
+    cost: int = 0
+    category: NamedResource | None = None
+    effect_entries: list[EffectEntry] = msgspec.field(default_factory=list)
+    sprites: dict = msgspec.field(default_factory=dict)
+
+OFFICIAL_ARTWORK_PATH = ("other", "official-artwork", "front_default")
+SPECIES_URL_PATH = ("species", "url")
+COLOR_NAME_PATH = ("color", "name")
+SHAPE_NAME_PATH = ("shape", "name")
+
+def _walk(data: dict, path: tuple) -> object:
+    """Follows a tuple of keys through nested dicts, returning None if any
+    level is missing. Cheaper and clearer than chained .get({}) calls on
+    hot response-shaping paths.
+    """
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+# In-flight request map for single-flight deduplication: concurrent callers
+# asking for the same endpoint share one awaitable instead of issuing
+# duplicate HTTP requests.
+_inflight: dict[str, asyncio.Future] = {}
+
+async def _fetch_endpoint(endpoint: str) -> dict:
+    """Performs the actual HTTP GET for an endpoint. Never raises; API and
+    transport failures are mapped to the error-dictionary contract.
+    """
+    try:
+        client = await get_client()
+        response = await client.get(endpoint)
+        response.raise_for_status() # Raises an exception for 4XX/5XX responses
+        return orjson.loads(response.content)
+    except httpx.HTTPStatusError as e:
+        logger.error(f"PokeAPI request failed: {e.response.status_code} - {e.response.text}")
+        return {"error": f"API request failed with status {e.response.status_code}",
+                "status_code": e.response.status_code, "details": e.response.text}
+    except httpx.RequestError as e:
+        logger.error(f"PokeAPI request error: {e}")
+        return {"error": "API request error", "details": str(e)}
+    except Exception as e:
+        logger.error(f"An unexpected error occurred while fetching from PokeAPI: {e}")
+        return {"error": "An unexpected error occurred", "details": str(e)}
 
 # This is an internal helper function, NOT an MCP tool
 async def fetch_from_pokeapi(endpoint: str) -> dict:
     """Helper function to fetch data from PokeAPI.
 
+    Lookup order is memory cache -> in-flight request -> disk cache ->
+    network. Successful responses are cached in an LRU keyed on the
+    endpoint (and persisted to disk), and concurrent requests for the
+    same endpoint are coalesced into a single HTTP call.
+
     Args:
         endpoint: The API endpoint to call (e.g., /pokemon/pikachu).
 
@@ -38,30 +325,56 @@ async def fetch_from_pokeapi(endpoint: str) -> dict:
         A dictionary containing the JSON response from the API.
         Returns an error dictionary if the request fails.
     """
+    cached = _cache_get(endpoint)
+    if cached is not None:
+        logger.debug(f"Cache hit for {endpoint}")
+        return cached
+
+    existing = _inflight.get(endpoint)
+    if existing is not None:
+        logger.debug(f"Joining in-flight request for {endpoint}")
+        data = await existing
+        return dict(data) if isinstance(data, dict) else data
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[endpoint] = fut
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{POKEAPI_BASE_URL}{endpoint}")
-            response.raise_for_status() # Raises an exception for 4XX/5XX responses
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        logger.error(f"PokeAPI request failed: {e.response.status_code} - {e.response.text}")
-        return {"error": f"API request failed with status {e.response.status_code}", "details": e.response.text}
-    except httpx.RequestError as e:
-        logger.error(f"PokeAPI request error: {e}")
-        return {"error": "API request error", "details": str(e)}
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while fetching from PokeAPI: {e}")
-        return {"error": "An unexpected error occurred", "details": str(e)}
+        # Disk lookups run in a thread so the event loop is never blocked.
+        data = await asyncio.to_thread(_disk_cache.get, endpoint)
+        if data is not None:
+            logger.debug(f"Disk cache hit for {endpoint}")
+        else:
+            data = await _fetch_endpoint(endpoint)
+            if isinstance(data, dict) and not data.get("error"):
+                await asyncio.to_thread(_disk_cache.set, endpoint, data)
+    except BaseException as e: # e.g., cancellation; propagate to waiters too
+        if not fut.done():
+            fut.set_exception(e)
+        raise
+    else:
+        if not fut.done():
+            fut.set_result(data)
+        if isinstance(data, dict) and not data.get("error"):
+            _cache_set(endpoint, data)
+            return dict(data)
+        return data
+    finally:
+        _inflight.pop(endpoint, None)
 
 @mcp.tool() # This IS an MCP tool
-async def get_pokemon_details(pokemon_name_or_id: str) -> dict:
+async def get_pokemon_details(pokemon_name_or_id: str, include_species: bool = False) -> dict:
     """Fetches comprehensive details for a specific Pokémon from PokeAPI.
     Useful when you know the Pokémon's name or ID and need its full profile.
 
     Args:
-        pokemon_name_or_id (str): The English lowercase name (e.g., "pikachu", "charizard") 
+        pokemon_name_or_id (str): The English lowercase name (e.g., "pikachu", "charizard")
                                   or National Pokédex ID (e.g., 25, 6) of the Pokémon.
                                   Example: "pikachu" or 25.
+        include_species (bool, optional): When True, also fetches the species data
+                                          (concurrently with the Pokémon data) and adds
+                                          "color" and "shape" to the result, saving the
+                                          separate get_pokemon_color/get_pokemon_shape
+                                          round-trips. Defaults to False.
 
     Returns:
         dict: A dictionary containing key details about the Pokémon:
@@ -72,36 +385,61 @@ async def get_pokemon_details(pokemon_name_or_id: str) -> dict:
               - "types" (list[str]): List of its elemental types (e.g., ["electric"]).
               - "stats" (dict): Dictionary of base stats (e.g., {"hp": 35, "attack": 55, ...}).
               - "sprite_url" (str | None): URL to an official artwork image, if available.
+              - "color" / "shape" (str | None, only when include_species=True): Pokedex
+                color and shape, or a "species_error" entry if the species lookup failed.
               Returns an error dictionary if the Pokémon is not found or an API error occurs.
               Example error: {"error": "API request failed...", "details": "..."}
     """
-    logger.info(f"Tool 'get_pokemon_details' called for: {pokemon_name_or_id}")
-    processed_input = str(pokemon_name_or_id).lower()
-    data = await fetch_from_pokeapi(f"/pokemon/{processed_input}/")
+    logger.info(f"Tool 'get_pokemon_details' called for: {pokemon_name_or_id} (include_species={include_species})")
+    processed_input = _canonical_identifier(str(pokemon_name_or_id).lower())
+    species_data = None
+    if include_species:
+        # Both fetches are independent, so issue them concurrently instead of
+        # paying two serial round-trips.
+        data, species_data = await asyncio.gather(
+            fetch_from_pokeapi(f"/pokemon/{processed_input}/"),
+            get_species_data(processed_input),
+        )
+    else:
+        data = await fetch_from_pokeapi(f"/pokemon/{processed_input}/")
 
     if data.get("error"):
         return data # Return the error dict directly
 
     try:
-        types = [t['type']['name'] for t in data.get('types', [])]
-        stats = {s['stat']['name']: s['base_stat'] for s in data.get('stats', [])}
-        sprite_url = data.get('sprites', {}).get('other', {}).get('official-artwork', {}).get('front_default')
-        if not sprite_url:
-            sprite_url = data.get('sprites', {}).get('front_default')
-
-        return {
-            "id": data.get("id"),
-            "name": data.get("name"),
-            "height": data.get("height"),
-            "weight": data.get("weight"),
-            "types": types,
-            "stats": stats,
-            "sprite_url": sprite_url
-        }
-    except Exception as e:
+        pokemon = msgspec.convert(data, PokemonResponse)
+    except msgspec.ValidationError as e:
         logger.error(f"Error processing Pokémon data for {pokemon_name_or_id}: {e}")
         return {"error": "Failed to process Pokémon data", "details": str(e)}
 
+    sprite_url = _walk(pokemon.sprites, OFFICIAL_ARTWORK_PATH)
+    if not sprite_url:
+        sprite_url = pokemon.sprites.get('front_default')
+
+    result = {
+        "id": pokemon.id,
+        "name": pokemon.name,
+        "height": pokemon.height,
+        "weight": pokemon.weight,
+        "types": [t.type.name for t in pokemon.types],
+        "stats": {s.stat.name: s.base_stat for s in pokemon.stats},
+        "sprite_url": sprite_url
+    }
+
+    if species_data is not None:
+        if species_data.get("error"):
+            result["species_error"] = species_data["error"]
+        else:
+            try:
+                species = msgspec.convert(species_data, SpeciesResponse)
+                result["color"] = species.color.name if species.color else None
+                result["shape"] = species.shape.name if species.shape else None
+            except msgspec.ValidationError as e:
+                logger.error(f"Error processing species data for {pokemon_name_or_id}: {e}")
+                result["species_error"] = str(e)
+
+    return result
+
 @mcp.tool()
 async def get_pokemon_types(pokemon_name_or_id: str) -> dict:
     """Fetches the elemental types of a specific Pokémon (e.g., Fire, Water, Grass).
@@ -120,42 +458,56 @@ async def get_pokemon_types(pokemon_name_or_id: str) -> dict:
               Example: {"name": "bulbasaur", "id": 1, "types": ["grass", "poison"]}
     """
     logger.info(f"Tool 'get_pokemon_types' called for: {pokemon_name_or_id}")
-    processed_input = str(pokemon_name_or_id).lower()
+    processed_input = _canonical_identifier(str(pokemon_name_or_id).lower())
     data = await fetch_from_pokeapi(f"/pokemon/{processed_input}/")
 
     if data.get("error"):
         return data
 
     try:
-        types = [t['type']['name'] for t in data.get('types', [])]
-        return {"name": data.get("name"), "id": data.get("id"), "types": types}
-    except Exception as e:
+        pokemon = msgspec.convert(data, PokemonResponse)
+    except msgspec.ValidationError as e:
         logger.error(f"Error processing Pokémon types for {pokemon_name_or_id}: {e}")
         return {"error": "Failed to process Pokémon types", "details": str(e)}
 
+    return {"name": pokemon.name, "id": pokemon.id, "types": [t.type.name for t in pokemon.types]}
+
 async def get_species_data(pokemon_name_or_id: str) -> dict:
     """Helper to get pokemon-species data, which contains color and shape.
     This is an internal helper, not an MCP tool by itself.
     """
+    processed_input = _canonical_identifier(str(pokemon_name_or_id).lower())
+
+    # Most identifiers (all numeric IDs, and names where the species name
+    # matches the Pokémon name) resolve directly on the species endpoint,
+    # saving the extra /pokemon/ round-trip. Form names that 404 here fall
+    # back to the two-hop path below.
+    logger.debug(f"Trying direct species fetch for: {processed_input}")
+    species_data = await fetch_from_pokeapi(f"/pokemon-species/{processed_input}/")
+    if not species_data.get("error"):
+        return species_data
+    if species_data.get("status_code") != 404:
+        return species_data
+
     logger.debug(f"Fetching initial Pokemon data for species for: {pokemon_name_or_id}")
-    processed_input = str(pokemon_name_or_id).lower()
     pokemon_data = await fetch_from_pokeapi(f"/pokemon/{processed_input}/")
 
     if pokemon_data.get("error"):
         return pokemon_data
 
-    species_url = pokemon_data.get('species', {}).get('url')
+    species_url = _walk(pokemon_data, SPECIES_URL_PATH)
     if not species_url:
         logger.warning(f"Species URL not found for {pokemon_name_or_id}")
         return {"error": "Species URL not found", "name": pokemon_data.get("name")}
-    
-    # The species_url is absolute, so we need to remove the base URL part if fetch_from_pokeapi expects a relative path.
-    # Or, modify fetch_from_pokeapi to handle absolute URLs, or make a new helper.
-    # For now, assuming species_url is full and httpx.AsyncClient can handle it.
-    # Let's refine fetch_from_pokeapi or use a direct httpx call for absolute URLs if needed.
-    # Quick check: fetch_from_pokeapi prepends POKEAPI_BASE_URL, so it needs a relative path.
-    relative_species_endpoint = species_url.replace(POKEAPI_BASE_URL, "")
-    
+
+    # fetch_from_pokeapi keys its cache on relative endpoints, so strip the
+    # known fixed-length prefix. A slice can't accidentally rewrite the base
+    # URL if it ever appeared inside the path, unlike str.replace.
+    if species_url.startswith(POKEAPI_BASE_URL):
+        relative_species_endpoint = species_url[_BASE_LEN:]
+    else:
+        relative_species_endpoint = species_url
+
     logger.debug(f"Fetching species data from: {relative_species_endpoint}")
     species_data = await fetch_from_pokeapi(relative_species_endpoint)
     return species_data
@@ -184,14 +536,15 @@ async def get_pokemon_color(pokemon_name_or_id: str) -> dict:
         return data
     
     try:
-        color_name = data.get('color', {}).get('name')
-        if not color_name:
-            return {"error": "Color not found in species data", "name": data.get("name")}
-        return {"name": data.get("name", str(pokemon_name_or_id)), "id": data.get("id"), "color": color_name}
-    except Exception as e:
+        species = msgspec.convert(data, SpeciesResponse)
+    except msgspec.ValidationError as e:
         logger.error(f"Error processing Pokémon color for {pokemon_name_or_id}: {e}")
         return {"error": "Failed to process Pokémon color", "details": str(e)}
 
+    if species.color is None:
+        return {"error": "Color not found in species data", "name": species.name}
+    return {"name": species.name, "id": species.id, "color": species.color.name}
+
 @mcp.tool()
 async def get_pokemon_shape(pokemon_name_or_id: str) -> dict:
     """Fetches the Pokedex shape category of a specific Pokémon (e.g., humanoid, quadruped, wings).
@@ -216,44 +569,104 @@ async def get_pokemon_shape(pokemon_name_or_id: str) -> dict:
         return data
 
     try:
-        shape_name = data.get('shape', {}).get('name')
-        if not shape_name:
-             return {"error": "Shape not found in species data", "name": data.get("name")}
-        return {"name": data.get("name", str(pokemon_name_or_id)), "id": data.get("id"), "shape": shape_name}
-    except Exception as e:
+        species = msgspec.convert(data, SpeciesResponse)
+    except msgspec.ValidationError as e:
         logger.error(f"Error processing Pokémon shape for {pokemon_name_or_id}: {e}")
         return {"error": "Failed to process Pokémon shape", "details": str(e)}
 
+    if species.shape is None:
+        return {"error": "Shape not found in species data", "name": species.name}
+    return {"name": species.name, "id": species.id, "shape": species.shape.name}
+
+VALID_INCLUDE_FIELDS = ("color", "shape", "types")
+MAX_LIST_CONCURRENCY = 64 # Upper bound on parallel PokeAPI requests per listing call
+
+async def _enrich_pokemon_entry(name: str, include: tuple, sem: asyncio.Semaphore) -> dict:
+    """Helper to fetch the requested extra attributes for one Pokémon.
+    Runs under the shared semaphore so listing fan-out stays bounded.
+    """
+    async with sem:
+        entry = {"name": name}
+        if "color" in include or "shape" in include:
+            species_data = await get_species_data(name)
+            if species_data.get("error"):
+                entry["error"] = species_data["error"]
+            else:
+                if "color" in include:
+                    entry["color"] = _walk(species_data, COLOR_NAME_PATH)
+                if "shape" in include:
+                    entry["shape"] = _walk(species_data, SHAPE_NAME_PATH)
+        if "types" in include:
+            pokemon_data = await fetch_from_pokeapi(f"/pokemon/{_canonical_identifier(name)}/")
+            if pokemon_data.get("error"):
+                entry.setdefault("error", pokemon_data["error"])
+            else:
+                entry["types"] = [t['type']['name'] for t in pokemon_data.get('types') or ()]
+        return entry
+
 @mcp.tool()
-async def list_all_pokemon_names(limit: int = 2000, offset: int = 0) -> dict: # Increased default limit
-    """Lists English names of Pokémon, supporting pagination. 
-    Useful as a starting point for iterating through Pokémon or for broad searches 
+async def list_all_pokemon_names(limit: int = 2000, offset: int = 0,
+                                 include: list[str] | None = None,
+                                 concurrency: int = 32) -> dict: # Increased default limit
+    """Lists English names of Pokémon, supporting pagination.
+    Useful as a starting point for iterating through Pokémon or for broad searches
     when the exact name is unknown. The total number of Pokémon can be high.
+    Optionally enriches each entry with color/shape/types, fetched concurrently,
+    so descriptive queries (e.g., 'find a yellow bipedal Pokémon') need one call
+    instead of one call per Pokémon.
 
     Args:
         limit (int, optional): The maximum number of Pokémon names to return. Defaults to 2000.
                                Max value is determined by PokeAPI (around 1300+ as of latest checks).
         offset (int, optional): The offset from which to start listing. Defaults to 0.
+        include (list[str], optional): Extra attributes to fetch per Pokémon. Any of
+                                       "color", "shape", "types". Defaults to None (names only).
+        concurrency (int, optional): Maximum number of concurrent PokeAPI requests used
+                                     for enrichment. Defaults to 32, capped at 64.
 
     Returns:
         dict: A dictionary containing:
               - "count" (int): The total number of Pokémon resources available in PokeAPI.
               - "pokemon_names" (list[str]): A list of Pokémon English lowercase names.
+              - "pokemon" (list[dict], only when include is given): One dict per Pokémon
+                with "name" plus the requested attributes (or an "error" entry for
+                individual lookups that failed).
               Returns an error dictionary on API error.
               Example: {"count": 1302, "pokemon_names": ["bulbasaur", "ivysaur", ...]}
     """
-    logger.info(f"Tool 'list_all_pokemon_names' called with limit={limit}, offset={offset}")
-    data = await fetch_from_pokeapi(f"/pokemon?limit={limit}&offset={offset}")
-
-    if data.get("error"):
-        return data
-
-    try:
-        names = [p['name'] for p in data.get('results', [])]
-        return {"count": data.get("count"), "pokemon_names": names}
-    except Exception as e:
-        logger.error(f"Error processing Pokémon list: {e}")
-        return {"error": "Failed to process Pokémon list", "details": str(e)}
+    logger.info(f"Tool 'list_all_pokemon_names' called with limit={limit}, offset={offset}, include={include}")
+    if _ALL_POKEMON:
+        # Serve from the startup snapshot; no network I/O on this path.
+        names = list(_ALL_POKEMON[offset:offset + limit])
+        result = {"count": _ALL_COUNT, "pokemon_names": names}
+    else:
+        # Snapshot unavailable (startup fetch failed); fall back to a live listing.
+        data = await _fetch_name_index(f"/pokemon?limit={limit}&offset={offset}")
+
+        if data.get("error"):
+            return data
+
+        names = data["names"]
+        result = {"count": data["count"], "pokemon_names": names}
+
+    if include:
+        invalid = [f for f in include if f not in VALID_INCLUDE_FIELDS]
+        if invalid:
+            return {"error": f"Invalid include fields: {invalid}. Valid fields are {list(VALID_INCLUDE_FIELDS)}"}
+        include_fields = tuple(include)
+        sem = asyncio.Semaphore(max(1, min(concurrency, MAX_LIST_CONCURRENCY)))
+        tasks = [asyncio.create_task(_enrich_pokemon_entry(name, include_fields, sem)) for name in names]
+        entries = await asyncio.gather(*tasks, return_exceptions=True)
+        result["pokemon"] = [
+            entry if isinstance(entry, dict) else {"name": name, "error": str(entry)}
+            for name, entry in zip(names, entries)
+        ]
+
+    return result
+
+# Memoized {item name: English short_effect} index, filled as items are
+# first parsed so repeat lookups skip the effect_entries scan.
+_item_short_effects: dict[str, str] = {}
 
 @mcp.tool()
 async def get_item_details(item_name_or_id: str) -> dict:
@@ -283,26 +696,31 @@ async def get_item_details(item_name_or_id: str) -> dict:
         return data
 
     try:
-        short_effect_english = "N/A"
-        for entry in data.get('effect_entries', []):
-            if entry.get('language', {}).get('name') == 'en':
-                short_effect_english = entry.get('short_effect', 'N/A')
-                break
-        
-        sprite_url = data.get('sprites', {}).get('default')
-
-        return {
-            "id": data.get("id"),
-            "name": data.get("name"),
-            "cost": data.get("cost", 0), # Default to 0 if cost is not present
-            "category": data.get('category', {}).get('name'),
-            "short_effect": short_effect_english,
-            "sprite_url": sprite_url
-        }
-    except Exception as e:
+        item = msgspec.convert(data, ItemResponse)
+    except msgspec.ValidationError as e:
         logger.error(f"Error processing item data for {item_name_or_id}: {e}")
         return {"error": "Failed to process item data", "details": str(e)}
 
+    # The English effect scan repeats on every response-cache hit, so its
+    # result is memoized per item name; warm calls are an O(1) dict lookup.
+    short_effect_english = _item_short_effects.get(item.name)
+    if short_effect_english is None:
+        short_effect_english = "N/A"
+        for entry in item.effect_entries:
+            if entry.language.name == 'en':
+                short_effect_english = entry.short_effect
+                break
+        _item_short_effects[item.name] = short_effect_english
+
+    return {
+        "id": item.id,
+        "name": item.name,
+        "cost": item.cost,
+        "category": item.category.name if item.category else None,
+        "short_effect": short_effect_english,
+        "sprite_url": item.sprites.get('default')
+    }
+
 @mcp.tool()
 async def list_all_items(limit: int = 100, offset: int = 0) -> dict:
     """Lists in-game items from PokeAPI, supporting pagination.
@@ -318,19 +736,20 @@ async def list_all_items(limit: int = 100, offset: int = 0) -> dict:
               Returns an error dictionary on API error.
     """
     logger.info(f"Tool 'list_all_items' called with limit={limit}, offset={offset}")
-    data = await fetch_from_pokeapi(f"/item?limit={limit}&offset={offset}")
+    data = await _fetch_name_index(f"/item?limit={limit}&offset={offset}")
 
     if data.get("error"):
         return data
 
-    try:
-        names = [i['name'] for i in data.get('results', [])]
-        return {"count": data.get("count"), "item_names": names}
-    except Exception as e:
-        logger.error(f"Error processing item list: {e}")
-        return {"error": "Failed to process item list", "details": str(e)}
+    return {"count": data["count"], "item_names": data["names"]}
 
 if __name__ == '__main__':
+    try:
+        import uvloop # Faster event loop for the socket-heavy SSE + httpx workload
+        uvloop.install()
+        logger.info("Using uvloop event loop.")
+    except ImportError:
+        logger.info("uvloop not available; using the default asyncio event loop.")
     logger.info("Starting MCP server with SSE transport...")
     mcp.run(transport='sse', port=7796, host="0.0.0.0")
     logger.info("MCP server stopped.") 
\ No newline at end of file